@@ -104,13 +104,14 @@ class HHTypedNeuron(bst.nn.Dynamics, Container, DiffEqModule):
         return self.update(*args, **kwargs)
 
     def init_state(self, batch_size=None):
-        nodes = self.nodes(IonChannel, allowed_hierarchy=(1, 1)).values()
+        self._ion_channel_paths = None
+        nodes = self._ion_channel_nodes()
         TreeNode.check_hierarchies(self.__class__, *nodes)
         for channel in nodes:
             channel.init_state(self.V.value, batch_size=batch_size)
 
     def reset_state(self, batch_size=None):
-        nodes = self.nodes(IonChannel, allowed_hierarchy=(1, 1)).values()
+        nodes = self._ion_channel_nodes()
         for channel in nodes:
             channel.reset_state(self.V.value, batch_size=batch_size)
 
@@ -123,6 +124,28 @@ class HHTypedNeuron(bst.nn.Dynamics, Container, DiffEqModule):
         """
         TreeNode.check_hierarchies(type(self), **elements)
         self.ion_channels.update(self._format_elements(IonChannel, **elements))
+        self._ion_channel_paths = None
+
+    def _ion_channel_nodes(self) -> Tuple[IonChannel, ...]:
+        """
+        Get the direct :py:class:`IonChannel` children of the neuron.
+
+        The node graph is only walked once. Then the paths of the channels are cached,
+        rather than the channels themselves, so that the cache stays out of the node
+        graph and remains valid for the cloned models.
+        """
+        paths = vars(self).get('_ion_channel_paths', None)
+        if paths is None:
+            paths = tuple(self.nodes(IonChannel, allowed_hierarchy=(1, 1)).keys())
+            self._ion_channel_paths = paths
+        return tuple(_get_node_by_path(self, path) for path in paths)
+
+
+def _get_node_by_path(root, path):
+    node = root
+    for key in path:
+        node = node[key] if isinstance(node, (dict, list, tuple)) else getattr(node, key)
+    return node
 
 
 class IonChannel(bst.graph.Node, TreeNode, DiffEqModule):
@@ -16,7 +16,7 @@
 from __future__ import annotations
 
 import importlib.util
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Tuple, Callable, Dict, Union, Sequence
 
 import brainstate as bst
@@ -65,6 +65,7 @@ __all__ = [
     'ralston3_step',
     'rk4_step',
     'ralston4_step',
+    'exp_euler_step',
 ]
 
 
@@ -428,29 +429,62 @@ def diffrax_solve(
 
 @dataclass(frozen=True)
 class ButcherTableau:
-    """The Butcher tableau for an explicit or diagonal Runge--Kutta method."""
+    """The Butcher tableau for an explicit Runge--Kutta method."""
 
     A: Sequence[Sequence]  # The A matrix in the Butcher tableau.
     B: Sequence  # The B vector in the Butcher tableau.
     C: Sequence  # The C vector in the Butcher tableau.
 
+    # The non-zero ``(stage, coefficient)`` pairs of each row of A, and of B.
+    A_terms: Tuple = field(init=False, repr=False, compare=False)
+    B_terms: Tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Freeze the coefficients into tuples of Python floats. The tableau is then
+        # hashable, and the stage loop unrolls against constants at trace time.
+        object.__setattr__(self, 'A', tuple(tuple(float(a) for a in row) for row in self.A))
+        object.__setattr__(self, 'B', tuple(float(b) for b in self.B))
+        object.__setattr__(self, 'C', tuple(float(c) for c in self.C))
+
+        # Check the shape once here, so that the stepping functions can rely on it.
+        if not (len(self.A) == len(self.B) == len(self.C)):
+            raise ValueError(f'A, B and C must have the same number of stages. '
+                             f'Got {len(self.A)}, {len(self.B)} and {len(self.C)}.')
+        for i, row in enumerate(self.A):
+            if len(row) != i:
+                raise ValueError(f'The row {i} of A must have {i} coefficients for an explicit '
+                                 f'Runge-Kutta method. Got {row}.')
+
+        # Precompute the sparse rows once. Zero coefficients (frequent in RK4-like
+        # tableaus) contribute nothing, so they are never traced into the step.
+        object.__setattr__(self, 'A_terms', tuple(_nonzero_terms(row) for row in self.A))
+        object.__setattr__(self, 'B_terms', _nonzero_terms(self.B))
+
+
+def _nonzero_terms(coeff: Sequence[float]) -> Tuple[Tuple[int, float], ...]:
+    return tuple((i, c) for i, c in enumerate(coeff) if c != 0.)
+
 
 def _rk_update(
-    coeff: Sequence,
-    st: bst.State,
-    y0: bst.typing.PyTree,
-    *ks
+    terms: Sequence[Tuple[int, float]],
+    states: Sequence[bst.State],
+    y0: Sequence[bst.typing.PyTree],
+    dt: bst.typing.ArrayLike,
+    ks: Sequence[Sequence[bst.typing.PyTree]],
 ):
-    assert len(coeff) == len(ks), 'The number of coefficients must be equal to the number of ks.'
-
     def _step(y0_, *k_):
-        kds = [c_ * k_ for c_, k_ in zip(coeff, k_)]
-        update = kds[0]
-        for kd in kds[1:]:
-            update += kd
-        return y0_ + update * bst.environ.get_dt()
+        if len(terms) == 0:
+            return y0_
+        # accumulate the weighted increments in one expression, so that
+        # no intermediate list is built and XLA fuses the whole update
+        (i0, c0), *rest = terms
+        update = sum((c * k_[i] for i, c in rest), c0 * k_[i0])
+        return y0_ + update * dt
 
-    st.value = jax.tree.map(_step, y0, *ks, is_leaf=u.math.is_quantity)
+    # one traversal over the initial values of all states, then write them back
+    new_values = jax.tree.map(_step, list(y0), *ks, is_leaf=u.math.is_quantity)
+    for st, val in zip(states, new_values):
+        st.value = val
 
 
 @set_module_as('dendritex')
@@ -458,9 +492,14 @@ def _general_rk_step(
     tableau: ButcherTableau,
     target: DiffEqModule,
     t: jax.typing.ArrayLike,
-    *args
+    *args,
 ):
+    # The stage updates map over ``y0``, so they always keep the tree structure
+    # of the states and the structural check is not entered here. To check it
+    # while debugging, wrap the integrator call in ``bst.check_state_value_tree()``.
+
     dt = bst.environ.get_dt()
+    t_stages = [t + c * dt for c in tableau.C]
 
     # before one-step integration
     target.pre_integral(*args)
@@ -469,8 +508,7 @@ def _general_rk_step(
     ks = []
 
     # k1: first derivative step
-    assert len(tableau.A[0]) == 0, f'The first row of A must be empty. Got {tableau.A[0]}'
-    with bst.environ.context(t=t + tableau.C[0] * dt), bst.StateTraceStack() as trace:
+    with bst.environ.context(t=t_stages[0]), bst.StateTraceStack() as trace:
         # compute derivative
         target.compute_derivative(*args)
 
@@ -490,18 +528,14 @@ def _general_rk_step(
         ks.append(k1hs)
 
     # intermediate steps
-    for i in range(1, len(tableau.C)):
-        with bst.environ.context(t=t + tableau.C[i] * dt), bst.check_state_value_tree():
-            for st, y0_, *ks_ in zip(states, y0, *ks):
-                _rk_update(tableau.A[i], st, y0_, *ks_)
+    for a_row, t_stage in zip(tableau.A_terms[1:], t_stages[1:]):
+        with bst.environ.context(t=t_stage):
+            _rk_update(a_row, states, y0, dt, ks)
             target.compute_derivative(*args)
             ks.append([st.derivative for st in states])
 
-    # final step
-    with bst.check_state_value_tree():
-        # update states with derivatives
-        for st, y0_, *ks_ in zip(states, y0, *ks):
-            _rk_update(tableau.B, st, y0_, *ks_)
+    # final step: update states with derivatives
+    _rk_update(tableau.B_terms, states, y0, dt, ks)
 
 
 euler_tableau = ButcherTableau(
@@ -632,3 +666,84 @@ def rk4_step(target: DiffEqModule, t: bst.typing.ArrayLike, *args):
 @set_module_as('dendritex')
 def ralston4_step(target: DiffEqModule, t: bst.typing.ArrayLike, *args):
     _general_rk_step(ralston4_tableau, target, t, *args)
+
+
+@set_module_as('dendritex')
+def exp_euler_step(target: DiffEqModule, t: bst.typing.ArrayLike, *args):
+    r"""
+    The exponential Euler step.
+
+    Each differential equation state :math:`y` is advanced by
+
+    .. math::
+
+        y_{n+1} = y_n + \Delta t \, f(y_n) \, \frac{e^{a \Delta t} - 1}{a \Delta t},
+        \quad a = \frac{\partial f}{\partial y}(y_n),
+
+    which is exact for the linear gating dynamics of the form
+    :math:`dx/dt = \alpha(V)(1-x) - \beta(V)x` (the ``cnexp`` method of NEURON),
+    and stable for stiff gates at any ``dt``. The linear part :math:`a` is the
+    directional derivative of each state's own derivative with respect to that
+    state, the other states being held fixed.
+
+    .. note::
+
+       :math:`a` is obtained by perturbing all elements of a state together, so it
+       is the row sum of the state's Jacobian rather than its diagonal. This is exact
+       for elementwise dynamics such as channel gates, but terms that couple the
+       elements of one state — e.g. the axial coupling of the membrane potential
+       in :class:`MultiCompartment` — cancel out of :math:`a`. Such terms are
+       integrated explicitly and are subject to the usual step-size limit.
+
+    Args:
+      target: The differential equation module to integrate.
+      t: The current time.
+      *args: The arguments passed to ``target.compute_derivative``.
+    """
+    dt = bst.environ.get_dt()
+
+    # before one-step integration
+    target.pre_integral(*args)
+
+    def _derivatives(*args_):
+        with bst.StateTraceStack() as trace:
+            target.compute_derivative(*args_)
+        derivatives = []
+        for st, writen in zip(trace.states, trace.been_writen):
+            if isinstance(st, DiffEqState):
+                assert writen, f'State {st} must be written.'
+                derivatives.append(st.derivative)
+            else:
+                if writen:
+                    raise ValueError(f'State {st} is not for integral.')
+        return derivatives
+
+    with bst.environ.context(t=t):
+        # the derivatives as a pure function of the state values
+        stateful_fn = bst.compile.StatefulFunction(_derivatives).make_jaxpr(*args)
+        states = stateful_fn.get_states()
+        state_vals = [st.value for st in states]
+        indices = [i for i, st in enumerate(states) if isinstance(st, DiffEqState)]
+
+        def _fun(y):
+            vals = list(state_vals)
+            for i, v in zip(indices, y):
+                vals[i] = v
+            return stateful_fn.jaxpr_call(vals, *args)[1]
+
+        y0 = [state_vals[i] for i in indices]
+        f0, f_jvp = jax.linearize(_fun, y0)
+
+    zeros = jax.tree.map(u.math.zeros_like, y0, is_leaf=u.math.is_quantity)
+    for k, i in enumerate(indices):
+        # the slope of the k-th derivative along its own state
+        one = jax.tree.map(u.math.ones_like, y0[k], is_leaf=u.math.is_quantity)
+        dfk = f_jvp(zeros[:k] + [one] + zeros[k + 1:])[k]
+
+        def _step(y0_, f0_, df_, one_):
+            z = u.maybe_decimal(dt * df_ / one_)
+            return y0_ + dt * f0_ * u.math.exprel(z)
+
+        states[i].value = jax.tree.map(_step, y0[k], f0[k], dfk, one, is_leaf=u.math.is_quantity)
+        # the derivatives written while tracing are tracers, replace them with the evaluated ones
+        states[i].derivative = f0[k]
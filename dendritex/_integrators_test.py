@@ -0,0 +1,67 @@
+# Copyright 2024 BDP Ecosystem Limited. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import unittest
+
+import brainstate as bst
+import brainunit as u
+import jax.numpy as jnp
+import numpy as np
+
+import dendritex as dx
+
+
+class Relaxation(bst.nn.Module, dx.DiffEqModule):
+    """dy/dt = (y_inf - y) / tau"""
+
+    def __init__(self, y0, y_inf, tau):
+        super().__init__()
+        self.y0 = y0
+        self.y_inf = y_inf
+        self.tau = tau
+
+    def init_state(self):
+        self.y = dx.DiffEqState(self.y0)
+
+    def compute_derivative(self):
+        self.y.derivative = (self.y_inf - self.y.value) / self.tau
+
+
+class TestExpEulerStep(unittest.TestCase):
+    def test_linear_relaxation_is_exact(self):
+        y0 = jnp.asarray([0., 0.5, 2.])
+        y_inf = jnp.asarray([1., -1., 0.3])
+        tau = jnp.asarray([0.5, 2., 10.]) * u.ms
+        n_step = 20
+
+        # the step is exact for linear dynamics, so even dt > tau is fine
+        for dt in (0.01 * u.ms, 1. * u.ms):
+            with bst.environ.context(dt=dt):
+                model = Relaxation(y0, y_inf, tau)
+                model.init_state()
+                for i in range(n_step):
+                    y_prev = model.y.value
+                    dx.exp_euler_step(model, i * dt)
+
+            expected = y_inf + (y0 - y_inf) * np.exp(-(n_step * dt / tau))
+            np.testing.assert_allclose(model.y.value, expected, rtol=1e-5, atol=1e-6)
+            # the derivative at the start of the last step is left as a concrete value
+            np.testing.assert_allclose(model.y.derivative.to_decimal(1 / u.ms),
+                                       ((y_inf - y_prev) / tau).to_decimal(1 / u.ms),
+                                       rtol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,10 +15,13 @@
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Optional
 
 import brainstate as bst
 
+_Node = bst.graph.Node
+_object_getattr = object.__getattribute__
+
 
 def set_module_as(name: str):
     def decorator(module):
@@ -49,7 +52,7 @@ class Container(bst.mixin.Mixin):
         """
         Overwrite the slice access (`self['']`).
         """
-        children = self.__getattr__(self._container_name)
+        children = _object_getattr(self, self._container_name)
         if item in children:
             return children[item]
         else:
@@ -59,13 +62,17 @@ class Container(bst.mixin.Mixin):
         """
         Overwrite the dot access (`self.`).
         """
-        name = super().__getattribute__('_container_name')
-        if item == '_container_name':
-            return name
-        children = super().__getattribute__(name)
+        # `__getattr__` only runs after the normal lookup failed, so the
+        # container dict is read with a single direct lookup
+        name = _object_getattr(self, '_container_name')
         if item == name:
-            return children
-        return children[item] if item in children else super().__getattribute__(item)
+            return _object_getattr(self, name)
+        children = _object_getattr(self, name)
+        if item in children:
+            return children[item]
+        # a miss is resolved by the normal lookup again, so that an AttributeError
+        # raised inside a property reports the attribute that is really missing
+        return _object_getattr(self, item)
 
     def add_elem(self, *elems, **elements):
         """
@@ -95,20 +102,54 @@ class TreeNode(bst.mixin.Mixin):
                             f'of {leaf.root_type}, but the root now is {root}.')
 
     @staticmethod
-    def check_hierarchies(root: type, *leaves, check_fun: Callable = None, **named_leaves):
+    def check_hierarchies(
+        root: type,
+        *leaves,
+        check_fun: Callable = None,
+        _visited: Optional[set] = None,
+        **named_leaves
+    ):
         if check_fun is None:
             check_fun = TreeNode._root_leaf_pair_check
+        # shared leaves and containers are only checked once (keyed by their id)
+        if _visited is None:
+            _visited = set()
 
         for leaf in leaves:
-            if isinstance(leaf, bst.graph.Node):
+            if id(leaf) in _visited:
+                continue
+            _visited.add(id(leaf))
+            handler = _LEAF_HANDLERS.get(type(leaf))
+            if handler is not None:
+                handler(root, leaf, check_fun, _visited)
+            elif isinstance(leaf, _Node):
                 check_fun(root, leaf)
             elif isinstance(leaf, (list, tuple)):
-                TreeNode.check_hierarchies(root, *leaf, check_fun=check_fun)
+                TreeNode.check_hierarchies(root, *leaf, check_fun=check_fun, _visited=_visited)
             elif isinstance(leaf, dict):
-                TreeNode.check_hierarchies(root, **leaf, check_fun=check_fun)
+                TreeNode.check_hierarchies(root, **leaf, check_fun=check_fun, _visited=_visited)
             else:
                 raise ValueError(f'Do not support {type(leaf)}.')
         for leaf in named_leaves.values():
-            if not isinstance(leaf, bst.graph.Node):
-                raise ValueError(f'Do not support {type(leaf)}. Must be instance of {bst.graph.Node}')
+            if not isinstance(leaf, _Node):
+                raise ValueError(f'Do not support {type(leaf)}. Must be instance of {_Node}')
+            if id(leaf) in _visited:
+                continue
+            _visited.add(id(leaf))
             check_fun(root, leaf)
+
+
+def _check_sequence(root, leaves, check_fun, visited):
+    TreeNode.check_hierarchies(root, *leaves, check_fun=check_fun, _visited=visited)
+
+
+def _check_dict(root, leaves, check_fun, visited):
+    TreeNode.check_hierarchies(root, **leaves, check_fun=check_fun, _visited=visited)
+
+
+# exact-type dispatch for the common containers in `TreeNode.check_hierarchies`
+_LEAF_HANDLERS = {
+    list: _check_sequence,
+    tuple: _check_sequence,
+    dict: _check_dict,
+}
@@ -35,6 +35,51 @@ __all__ = [
 ]
 
 
+def _where_below(V, V_th, f_below, above):
+    """
+    Piecewise function of the voltage, ``f_below(V)`` below ``V_th`` and ``above`` elsewhere.
+
+    ``f_below`` is evaluated at the voltage clamped to ``V_th``, so that the unselected
+    lanes stay finite and do not leak NaN gradients through the select.
+    """
+    return bu.math.where(V < V_th, f_below(bu.math.minimum(V, V_th)), above)
+
+
+# Kinetics shared by IKA1_HM1992 and IKA2_HM1992, and by IKK2A_HM1992 and IKK2B_HM1992.
+# They take the shifted voltage (V - V_sh) in mV. When two channels of a pair share
+# the same V_sh, the fused step evaluates these terms only once.
+
+def _ika_p_tau(V):
+    return 1. / (bu.math.exp((V + 35.8) / 19.7) +
+                 bu.math.exp(-(V + 79.7) / 12.7)) + 0.37
+
+
+def _ika_q_inf(V):
+    return bu.math.sigmoid(-(V + 78.) / 6.)
+
+
+def _ika_q_tau(V):
+    return _where_below(
+        V, -63.,
+        lambda V: 1. / (bu.math.exp((V + 46.) / 5.) +
+                        bu.math.exp(-(V + 238.) / 37.5)),
+        19.
+    )
+
+
+def _ikk2_p_inf(V):
+    return bu.math.sigmoid((V + 43.) / 17.)
+
+
+def _ikk2_p_tau(V):
+    return 1. / (bu.math.exp((V - 81.) / 25.6) +
+                 bu.math.exp(-(V + 132) / 18.)) + 9.9
+
+
+def _ikk2_q_inf(V):
+    return bu.math.sigmoid(-(V + 58.) / 10.6)
+
+
 class PotassiumChannel(Channel):
     """Base class for sodium channel dynamics."""
     __module__ = 'dendritex.channels'
@@ -59,6 +104,10 @@ class PotassiumChannel(Channel):
     def reset_state(self, V, K: IonInfo, batch_size: int = None):
         pass
 
+    def _shifted(self, V):
+        # the membrane potential shifted by ``V_sh``, as a plain array in mV
+        return (V - self.V_sh).to_decimal(bu.mV)
+
 
 class _IK_p4_markov(PotassiumChannel):
     r"""The delayed rectifier potassium channel of :math:`p^4`
@@ -104,24 +153,37 @@ class _IK_p4_markov(PotassiumChannel):
         self.p = DiffEqState(bst.init.param(bu.math.zeros, self.varshape, batch_size))
 
     def reset_state(self, V, K: IonInfo, batch_size: int = None):
-        alpha = self.f_p_alpha(V)
-        beta = self.f_p_beta(V)
+        alpha, beta = self._p_rates(V)
         self.p.value = alpha / (alpha + beta)
-        if isinstance(batch_size, int):
-            assert self.p.value.shape[0] == batch_size
 
     def compute_derivative(self, V, K: IonInfo):
         p = self.p.value
-        dp = self.phi * (self.f_p_alpha(V) * (1. - p) - self.f_p_beta(V) * p) / bu.ms
+        alpha, beta = self._p_rates(V)
+        # alpha * (1 - p) - beta * p, written as one multiply-add of the state
+        dp = self.phi / bu.ms * (alpha - (alpha + beta) * p)
         self.p.derivative = dp
 
     def current(self, V, K: IonInfo):
-        return self.g_max * self.p.value ** 4 * (K.E - V)
+        p2 = self.p.value * self.p.value
+        return self.g_max * (p2 * p2) * (K.E - V)
 
     def f_p_alpha(self, V):
-        raise NotImplementedError
+        return self._p_alpha(self._shifted(V))
 
     def f_p_beta(self, V):
+        return self._p_beta(self._shifted(V))
+
+    def _p_rates(self, V):
+        # both rates at once, so that the voltage is shifted only once
+        V = self._shifted(V)
+        return self._p_alpha(V), self._p_beta(V)
+
+    @staticmethod
+    def _p_alpha(V):
+        raise NotImplementedError
+
+    @staticmethod
+    def _p_beta(V):
         raise NotImplementedError
 
 
@@ -189,13 +251,14 @@ class IKDR_Ba2002(_IK_p4_markov):
         self.T_base = bst.init.param(T_base, self.varshape, allow_none=False)
         self.V_sh = bst.init.param(V_sh, self.varshape, allow_none=False)
 
-    def f_p_alpha(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
+    @staticmethod
+    def _p_alpha(V):
         tmp = V - 15.
-        return 0.032 * tmp / (1. - bu.math.exp(-tmp / 5.))
+        # tmp / (1 - exp(-tmp / 5)), without the 0/0 at tmp = 0
+        return 0.032 * 5. / bu.math.exprel(-tmp / 5.)
 
-    def f_p_beta(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
+    @staticmethod
+    def _p_beta(V):
         return 0.5 * bu.math.exp(-(V - 10.) / 40.)
 
 
@@ -252,13 +315,15 @@ class IK_TM1991(_IK_p4_markov):
         )
         self.V_sh = bst.init.param(V_sh, self.varshape, allow_none=False)
 
-    def f_p_alpha(self, V):
-        c = 15 + (- V + self.V_sh).to_decimal(bu.mV)
-        return 0.032 * c / (bu.math.exp(c / 5) - 1.)
+    @staticmethod
+    def _p_alpha(V):
+        c = 15 - V
+        # c / (exp(c / 5) - 1), without the 0/0 at c = 0
+        return 0.032 * 5. / bu.math.exprel(c / 5)
 
-    def f_p_beta(self, V):
-        V = (self.V_sh - V).to_decimal(bu.mV)
-        return 0.5 * bu.math.exp((10 + V) / 40)
+    @staticmethod
+    def _p_beta(V):
+        return 0.5 * bu.math.exp((10 - V) / 40)
 
 
 class IK_HH1952(_IK_p4_markov):
@@ -315,13 +380,14 @@ class IK_HH1952(_IK_p4_markov):
         )
         self.V_sh = bst.init.param(V_sh, self.varshape, allow_none=False)
 
-    def f_p_alpha(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
+    @staticmethod
+    def _p_alpha(V):
         temp = V + 10
-        return 0.01 * temp / (1 - bu.math.exp(-temp / 10))
+        # temp / (1 - exp(-temp / 10)), without the 0/0 at temp = 0
+        return 0.01 * 10. / bu.math.exprel(-temp / 10)
 
-    def f_p_beta(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
+    @staticmethod
+    def _p_beta(V):
         return 0.125 * bu.math.exp(-(V + 20) / 80)
 
 
@@ -380,11 +446,13 @@ class _IKA_p4q_ss(PotassiumChannel):
         self.phi_q = bst.init.param(phi_q, self.varshape, allow_none=False)
 
     def compute_derivative(self, V, K: IonInfo):
-        self.p.derivative = self.phi_p * (self.f_p_inf(V) - self.p.value) / self.f_p_tau(V) / bu.ms
-        self.q.derivative = self.phi_q * (self.f_q_inf(V) - self.q.value) / self.f_q_tau(V) / bu.ms
+        p_inf, p_tau, q_inf, q_tau = self._pq_kinetics(V)
+        self.p.derivative = self.phi_p / bu.ms * (p_inf - self.p.value) / p_tau
+        self.q.derivative = self.phi_q / bu.ms * (q_inf - self.q.value) / q_tau
 
     def current(self, V, K: IonInfo):
-        return self.g_max * self.p.value ** 4 * self.q.value * (K.E - V)
+        p2 = self.p.value * self.p.value
+        return self.g_max * (p2 * p2) * self.q.value * (K.E - V)
 
     def init_state(self, V, K: IonInfo, batch_size: int = None):
         self.p = DiffEqState(bst.init.param(bu.math.zeros, self.varshape, batch_size))
@@ -393,20 +461,38 @@ class _IKA_p4q_ss(PotassiumChannel):
     def reset_state(self, V, K: IonInfo, batch_size=None):
         self.p.value = self.f_p_inf(V)
         self.q.value = self.f_q_inf(V)
-        if isinstance(batch_size, int):
-            assert self.p.value.shape[0] == batch_size
-            assert self.q.value.shape[0] == batch_size
 
     def f_p_inf(self, V):
-        raise NotImplementedError
+        return self._p_inf(self._shifted(V))
 
     def f_p_tau(self, V):
-        raise NotImplementedError
+        return self._p_tau(self._shifted(V))
 
     def f_q_inf(self, V):
-        raise NotImplementedError
+        return self._q_inf(self._shifted(V))
 
     def f_q_tau(self, V):
+        return self._q_tau(self._shifted(V))
+
+    def _pq_kinetics(self, V):
+        # all four functions at once, so that the voltage is shifted only once
+        V = self._shifted(V)
+        return self._p_inf(V), self._p_tau(V), self._q_inf(V), self._q_tau(V)
+
+    @staticmethod
+    def _p_inf(V):
+        raise NotImplementedError
+
+    @staticmethod
+    def _p_tau(V):
+        raise NotImplementedError
+
+    @staticmethod
+    def _q_inf(V):
+        raise NotImplementedError
+
+    @staticmethod
+    def _q_tau(V):
         raise NotImplementedError
 
 
@@ -479,27 +565,14 @@ class IKA1_HM1992(_IKA_p4q_ss):
         # parameters
         self.V_sh = bst.init.param(V_sh, self.varshape, allow_none=False)
 
-    def f_p_inf(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (1. + bu.math.exp(-(V + 60.) / 8.5))
-
-    def f_p_tau(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (bu.math.exp((V + 35.8) / 19.7) +
-                     bu.math.exp(-(V + 79.7) / 12.7)) + 0.37
-
-    def f_q_inf(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (1. + bu.math.exp((V + 78.) / 6.))
+    @staticmethod
+    def _p_inf(V):
+        return bu.math.sigmoid((V + 60.) / 8.5)
 
-    def f_q_tau(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return bu.math.where(
-            V < -63,
-            1. / (bu.math.exp((V + 46.) / 5.) +
-                  bu.math.exp(-(V + 238.) / 37.5)),
-            19.
-        )
+    # the kinetics shared with IKA2_HM1992
+    _p_tau = staticmethod(_ika_p_tau)
+    _q_inf = staticmethod(_ika_q_inf)
+    _q_tau = staticmethod(_ika_q_tau)
 
 
 class IKA2_HM1992(_IKA_p4q_ss):
@@ -571,27 +644,14 @@ class IKA2_HM1992(_IKA_p4q_ss):
         # parameters
         self.V_sh = bst.init.param(V_sh, self.varshape, allow_none=False)
 
-    def f_p_inf(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (1. + bu.math.exp(-(V + 36.) / 20.))
-
-    def f_p_tau(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (bu.math.exp((V + 35.8) / 19.7) +
-                     bu.math.exp(-(V + 79.7) / 12.7)) + 0.37
-
-    def f_q_inf(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (1. + bu.math.exp((V + 78.) / 6.))
+    @staticmethod
+    def _p_inf(V):
+        return bu.math.sigmoid((V + 36.) / 20.)
 
-    def f_q_tau(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return bu.math.where(
-            V < -63,
-            1. / (bu.math.exp((V + 46.) / 5.) +
-                  bu.math.exp(-(V + 238.) / 37.5)),
-            19.
-        )
+    # the kinetics shared with IKA1_HM1992
+    _p_tau = staticmethod(_ika_p_tau)
+    _q_inf = staticmethod(_ika_q_inf)
+    _q_tau = staticmethod(_ika_q_tau)
 
 
 class _IKK2_pq_ss(PotassiumChannel):
@@ -647,8 +707,9 @@ class _IKK2_pq_ss(PotassiumChannel):
         self.phi_q = bst.init.param(phi_q, self.varshape, allow_none=False)
 
     def compute_derivative(self, V, K: IonInfo):
-        self.p.derivative = self.phi_p * (self.f_p_inf(V) - self.p.value) / self.f_p_tau(V)
-        self.q.derivative = self.phi_q * (self.f_q_inf(V) - self.q.value) / self.f_q_tau(V)
+        p_inf, p_tau, q_inf, q_tau = self._pq_kinetics(V)
+        self.p.derivative = self.phi_p / bu.ms * (p_inf - self.p.value) / p_tau
+        self.q.derivative = self.phi_q / bu.ms * (q_inf - self.q.value) / q_tau
 
     def current(self, V, K: IonInfo):
         return self.g_max * self.p.value * self.q.value * (K.E - V)
@@ -660,20 +721,38 @@ class _IKK2_pq_ss(PotassiumChannel):
     def reset_state(self, V, K: IonInfo, batch_size=None):
         self.p.value = self.f_p_inf(V)
         self.q.value = self.f_q_inf(V)
-        if isinstance(batch_size, int):
-            assert self.p.value.shape[0] == batch_size
-            assert self.q.value.shape[0] == batch_size
 
     def f_p_inf(self, V):
-        raise NotImplementedError
+        return self._p_inf(self._shifted(V))
 
     def f_p_tau(self, V):
-        raise NotImplementedError
+        return self._p_tau(self._shifted(V))
 
     def f_q_inf(self, V):
-        raise NotImplementedError
+        return self._q_inf(self._shifted(V))
 
     def f_q_tau(self, V):
+        return self._q_tau(self._shifted(V))
+
+    def _pq_kinetics(self, V):
+        # all four functions at once, so that the voltage is shifted only once
+        V = self._shifted(V)
+        return self._p_inf(V), self._p_tau(V), self._q_inf(V), self._q_tau(V)
+
+    @staticmethod
+    def _p_inf(V):
+        raise NotImplementedError
+
+    @staticmethod
+    def _p_tau(V):
+        raise NotImplementedError
+
+    @staticmethod
+    def _q_inf(V):
+        raise NotImplementedError
+
+    @staticmethod
+    def _q_tau(V):
         raise NotImplementedError
 
 
@@ -742,21 +821,13 @@ class IKK2A_HM1992(_IKK2_pq_ss):
         # parameters
         self.V_sh = bst.init.param(V_sh, self.varshape, allow_none=False)
 
-    def f_p_inf(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (1. + bu.math.exp(-(V + 43.) / 17.))
-
-    def f_p_tau(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (bu.math.exp((V - 81.) / 25.6) +
-                     bu.math.exp(-(V + 132) / 18.)) + 9.9
+    # the kinetics shared with IKK2B_HM1992
+    _p_inf = staticmethod(_ikk2_p_inf)
+    _p_tau = staticmethod(_ikk2_p_tau)
+    _q_inf = staticmethod(_ikk2_q_inf)
 
-    def f_q_inf(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (1. + bu.math.exp((V + 58.) / 10.6))
-
-    def f_q_tau(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
+    @staticmethod
+    def _q_tau(V):
         return 1. / (bu.math.exp((V - 1329.) / 200.) +
                      bu.math.exp(-(V + 130.) / 7.1))
 
@@ -828,25 +899,17 @@ class IKK2B_HM1992(_IKK2_pq_ss):
         # parameters
         self.V_sh = bst.init.param(V_sh, self.varshape, allow_none=False)
 
-    def f_p_inf(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (1. + bu.math.exp(-(V + 43.) / 17.))
-
-    def f_p_tau(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (bu.math.exp((V - 81.) / 25.6) +
-                     bu.math.exp(-(V + 132) / 18.)) + 9.9
-
-    def f_q_inf(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (1. + bu.math.exp((V + 58.) / 10.6))
-
-    def f_q_tau(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return bu.math.where(
-            V < -70,
-            1. / (bu.math.exp((V - 1329.) / 200.) +
-                  bu.math.exp(-(V + 130.) / 7.1)),
+    # the kinetics shared with IKK2A_HM1992
+    _p_inf = staticmethod(_ikk2_p_inf)
+    _p_tau = staticmethod(_ikk2_p_tau)
+    _q_inf = staticmethod(_ikk2_q_inf)
+
+    @staticmethod
+    def _q_tau(V):
+        return _where_below(
+            V, -70.,
+            lambda V: 1. / (bu.math.exp((V - 1329.) / 200.) +
+                            bu.math.exp(-(V + 130.) / 7.1)),
             8.9
         )
 
@@ -910,7 +973,8 @@ class IKNI_Ya1989(PotassiumChannel):
         self.phi_q = bst.init.param(phi_q, self.varshape, allow_none=False)
 
     def compute_derivative(self, V, K: IonInfo):
-        self.p.derivative = self.phi_p * (self.f_p_inf(V) - self.p.value) / self.f_p_tau(V)
+        p_inf, p_tau = self._p_kinetics(V)
+        self.p.derivative = self.phi_p * (p_inf - self.p.value) / p_tau
 
     def current(self, V, K: IonInfo):
         return self.g_max * self.p.value * (K.E - V)
@@ -920,17 +984,22 @@ class IKNI_Ya1989(PotassiumChannel):
 
     def reset_state(self, V, K: IonInfo, batch_size=None):
         self.p.value = self.f_p_inf(V)
-        if isinstance(batch_size, int):
-            assert self.p.value.shape[0] == batch_size
+
+    def _p_kinetics(self, V):
+        # exp(-(V + 35) / 10) is the square of exp(-(V + 35) / 20), so one exp serves both,
+        # and tau_max / (3.3 / e + e) is rewritten as tau_max * e / (3.3 + e^2) to save a division
+        V = self._shifted(V)
+        e = bu.math.exp((V + 35.) * -0.05)
+        e2 = e * e
+        p_inf = 1. / (1. + e2)
+        p_tau = self.tau_max * e / (3.3 + e2)
+        return p_inf, p_tau
 
     def f_p_inf(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (1. + bu.math.exp(-(V + 35.) / 10.))
+        return self._p_kinetics(V)[0]
 
     def f_p_tau(self, V):
-        V = (V - self.V_sh).to_decimal(bu.mV)
-        temp = V + 35.
-        return self.tau_max / (3.3 * bu.math.exp(temp / 20.) + bu.math.exp(-temp / 20.))
+        return self._p_kinetics(V)[1]
 
 
 class IK_Leak(PotassiumChannel):
@@ -1039,22 +1108,21 @@ class IKv11_Ak2007(PotassiumChannel):
         alpha = self.f_p_alpha(V)
         beta = self.f_p_beta(V)
         self.p.value = alpha / (alpha + beta)
-        if isinstance(batch_size, int):
-            assert self.p.value.shape[0] == batch_size
 
     def compute_derivative(self, V, K: IonInfo):
-        self.p.derivative = self.phi * (
-            self.f_p_alpha(V) * (1. - self.p.value) - self.f_p_beta(V) * self.p.value) / bu.ms
+        self.p.derivative = self.phi / bu.ms * (
+            self.f_p_alpha(V) * (1. - self.p.value) - self.f_p_beta(V) * self.p.value)
 
     def current(self, V, K: IonInfo):
+        p2 = self.p.value * self.p.value
         if self.gateCurrent == 0:
-            ik = self.g_max * self.p.value ** 4 * (K.E - V)
+            ik = self.g_max * (p2 * p2) * (K.E - V)
         else:
-            ngateFlip = self.phi * (self.f_p_alpha(V) * (1. - self.p.value) - self.f_p_beta(V) * self.p.value) / bu.ms
+            ngateFlip = self.phi / bu.ms * (self.f_p_alpha(V) * (1. - self.p.value) - self.f_p_beta(V) * self.p.value)
             igate = (
                         1e12) * self.g_max / self.gunit * 1e6 * self.e0 * 4 * self.zn * ngateFlip  # NONSPECIFIC_CURRENT igate
 
-            ik = -igate + self.g_max * self.p.value ** 4 * (K.E - V)
+            ik = -igate + self.g_max * (p2 * p2) * (K.E - V)
         return ik
 
     def f_p_alpha(self, V):
@@ -1105,8 +1173,8 @@ class IKv34_Ma2020(PotassiumChannel):
         self.hik = 11.2
 
     def compute_derivative(self, V, K: IonInfo):
-        self.p.derivative = self.phi * (self.f_p_inf(V) - self.p.value) / self.f_p_tau(V) / bu.ms
-        self.q.derivative = self.phi * (self.f_q_inf(V) - self.q.value) / self.f_q_tau(V) / bu.ms
+        self.p.derivative = self.phi / bu.ms * (self.f_p_inf(V) - self.p.value) / self.f_p_tau(V)
+        self.q.derivative = self.phi / bu.ms * (self.f_q_inf(V) - self.q.value) / self.f_q_tau(V)
 
     def current(self, V, K: IonInfo):
         return self.g_max * self.p.value ** 3 * self.q.value * (K.E - V)
@@ -1118,13 +1186,10 @@ class IKv34_Ma2020(PotassiumChannel):
     def reset_state(self, V, K: IonInfo, batch_size=None):
         self.p.value = self.f_p_inf(V)
         self.q.value = self.f_q_inf(V)
-        if isinstance(batch_size, int):
-            assert self.p.value.shape[0] == batch_size
-            assert self.q.value.shape[0] == batch_size
 
     def f_p_inf(self, V):
         V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1. / (1. + bu.math.exp(-(V - self.mivh) / self.mik))
+        return bu.math.sigmoid((V - self.mivh) / self.mik)
 
     def f_p_tau(self, V):
         V = (V - self.V_sh).to_decimal(bu.mV)
@@ -1138,7 +1203,7 @@ class IKv34_Ma2020(PotassiumChannel):
 
     def f_q_inf(self, V):
         V = (V - self.V_sh).to_decimal(bu.mV)
-        return self.hiy0 + self.hiA / (1 + bu.math.exp((V - self.hivh) / self.hik))
+        return self.hiy0 + self.hiA * bu.math.sigmoid(-(V - self.hivh) / self.hik)
 
     def f_q_tau(self, V):
         V = (V - self.V_sh).to_decimal(bu.mV)
@@ -1202,8 +1267,8 @@ class IKv43_Ma2020(PotassiumChannel):
         self.K_binf = 8.4
 
     def compute_derivative(self, V, K: IonInfo):
-        self.p.derivative = self.phi * (self.f_p_inf(V) - self.p.value) / self.f_p_tau(V) / bu.ms
-        self.q.derivative = self.phi * (self.f_q_inf(V) - self.q.value) / self.f_q_tau(V) / bu.ms
+        self.p.derivative = self.phi / bu.ms * (self.f_p_inf(V) - self.p.value) / self.f_p_tau(V)
+        self.q.derivative = self.phi / bu.ms * (self.f_q_inf(V) - self.q.value) / self.f_q_tau(V)
 
     def current(self, V, K: IonInfo):
         return self.g_max * self.p.value ** 3 * self.q.value * (K.E - V)
@@ -1215,12 +1280,9 @@ class IKv43_Ma2020(PotassiumChannel):
     def reset_state(self, V, K: IonInfo, batch_size=None):
         self.p.value = self.f_p_inf(V)
         self.q.value = self.f_q_inf(V)
-        if isinstance(batch_size, int):
-            assert self.p.value.shape[0] == batch_size
-            assert self.q.value.shape[0] == batch_size
 
     def sigm(self, x, y):
-        return 1 / (bu.math.exp(x / y) + 1)
+        return bu.math.sigmoid(-x / y)
 
     def f_p_alpha(self, V):
         V = (V - self.V_sh).to_decimal(bu.mV)
@@ -1240,14 +1302,14 @@ class IKv43_Ma2020(PotassiumChannel):
 
     def f_p_inf(self, V):
         V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1 / (1 + bu.math.exp((V - self.V0_ainf) / self.K_ainf))
+        return bu.math.sigmoid(-(V - self.V0_ainf) / self.K_ainf)
 
     def f_p_tau(self, V):
         return 1. / (self.f_p_alpha(V) + self.f_p_beta(V))
 
     def f_q_inf(self, V):
         V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1 / (1 + bu.math.exp((V - self.V0_binf) / self.K_binf))
+        return bu.math.sigmoid(-(V - self.V0_binf) / self.K_binf)
 
     def f_q_tau(self, V):
         return 1. / (self.f_q_alpha(V) + self.f_q_beta(V))
@@ -1298,7 +1360,7 @@ class IKM_Grc_Ma2020(PotassiumChannel):
         self.B_ninf = 6
 
     def compute_derivative(self, V, K: IonInfo):
-        self.p.derivative = self.phi * (self.f_p_inf(V) - self.p.value) / self.f_p_tau(V) / bu.ms
+        self.p.derivative = self.phi / bu.ms * (self.f_p_inf(V) - self.p.value) / self.f_p_tau(V)
 
     def current(self, V, K: IonInfo):
         return self.g_max * self.p.value * (self.ek - V)
@@ -1308,8 +1370,6 @@ class IKM_Grc_Ma2020(PotassiumChannel):
 
     def reset_state(self, V, K: IonInfo, batch_size=None):
         self.p.value = self.f_p_inf(V)
-        if isinstance(batch_size, int):
-            assert self.p.value.shape[0] == batch_size
 
     def f_p_alpha(self, V):
         V = (V - self.V_sh).to_decimal(bu.mV)
@@ -1321,7 +1381,7 @@ class IKM_Grc_Ma2020(PotassiumChannel):
 
     def f_p_inf(self, V):
         V = (V - self.V_sh).to_decimal(bu.mV)
-        return 1 / (1 + bu.math.exp(-(V - self.V0_ninf) / self.B_ninf))
+        return bu.math.sigmoid((V - self.V0_ninf) / self.B_ninf)
 
     def f_p_tau(self, V):
         return 1. / (self.f_p_alpha(V) + self.f_p_beta(V))
@@ -0,0 +1,64 @@
+# Copyright 2024 BDP Ecosystem Limited. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import unittest
+
+import brainstate as bst
+import brainunit as u
+import numpy as np
+
+import dendritex as dx
+
+
+class IK2Neuron(dx.neurons.SingleCompartment):
+    def __init__(self, size):
+        super().__init__(size, V_initializer=bst.init.Constant(-75. * u.mV))
+        self.k = dx.ions.PotassiumFixed(size, E=-90. * u.mV)
+        self.k.add_elem(IK2A=dx.channels.IKK2A_HM1992(size))
+        self.IL = dx.channels.IL(size, g_max=0.02 * (u.mS / u.cm ** 2), E=-60 * u.mV)
+
+
+class TestIKK2A(unittest.TestCase):
+    def test_integrate(self):
+        with bst.environ.context(dt=0.01 * u.ms):
+            neu = IK2Neuron(3)
+            neu.init_state()
+            neu.reset_state()
+            for i in range(100):
+                dx.rk4_step(neu, i * bst.environ.get_dt(), 1. * u.uA / u.cm ** 2)
+
+        channel = neu.k.IK2A
+        # the gate derivatives are rates in 1/ms
+        self.assertEqual(u.get_unit(channel.p.derivative), u.get_unit(1 / u.ms))
+        self.assertTrue(np.all(np.isfinite(channel.p.value)))
+        self.assertTrue(np.all(np.isfinite(channel.q.value)))
+        self.assertTrue(np.all(np.isfinite(neu.V.value.to_decimal(u.mV))))
+
+    def test_phi_reassignment(self):
+        channel = dx.channels.IKK2A_HM1992(3)
+        K = dx.IonInfo(C=None, E=-90. * u.mV)
+        V = -60. * u.mV
+        channel.init_state(V, K)
+        channel.p.value = u.math.zeros(3)
+        channel.compute_derivative(V, K)
+        dp = channel.p.derivative
+        channel.phi_p = channel.phi_p * 3.
+        channel.compute_derivative(V, K)
+        np.testing.assert_allclose(channel.p.derivative.to_decimal(1 / u.ms), 3. * dp.to_decimal(1 / u.ms),
+                                   rtol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
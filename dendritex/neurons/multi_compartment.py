@@ -22,7 +22,7 @@ import brainunit as bu
 import jax
 import numpy as np
 
-from dendritex._base import HHTypedNeuron, IonChannel
+from dendritex._base import HHTypedNeuron
 from dendritex._integrators import DiffEqState
 
 __all__ = [
@@ -183,38 +183,41 @@ class MultiCompartment(HHTypedNeuron):
 
     def pre_integral(self, *args):
         self._v_last_time = self.V.value
-        for key, node in self.nodes(IonChannel, allowed_hierarchy=(1, 1)).items():
+        for node in self._ion_channel_nodes():
             node.pre_integral(self.V.value)
 
     def compute_derivative(self, I_ext=0. * bu.nA):
+        channels = self._ion_channel_nodes()
+        V = self.V.value
+
         # [ Compute the derivative of membrane potential ]
         # 1. external currents
         I_ext = I_ext / self.A
         # 1.axial currents
-        I_axial = diffusive_coupling(self.V.value, self.connection, self.resistances) / self.A
+        I_axial = diffusive_coupling(V, self.connection, self.resistances) / self.A
         # 2. synapse currents
-        I_syn = self.sum_current_inputs(0. * bu.nA / bu.cm ** 2, self.V.value)
+        I_syn = self.sum_current_inputs(0. * bu.nA / bu.cm ** 2, V)
         # 3. channel currents
         I_channel = None
-        for key, ch in self.nodes(IonChannel, allowed_hierarchy=(1, 1)).items():
-            I_channel = ch.current(self.V.value) if I_channel is None else (I_channel + ch.current(self.V.value))
+        for ch in channels:
+            I_channel = ch.current(V) if I_channel is None else (I_channel + ch.current(V))
         # 4. derivatives
         self.V.derivative = (I_ext + I_axial + I_syn + I_channel) / self.cm
 
         # [ integrate dynamics of ion and ion channels ]
         # check whether the children channels have the correct parents.
-        for key, node in self.nodes(IonChannel, allowed_hierarchy=(1, 1)).items():
-            node.compute_derivative(self.V.value)
+        for node in channels:
+            node.compute_derivative(V)
 
     def update(self, *args):
         self.V.value = self.sum_delta_inputs(init=self.V.value)
-        for key, node in self.nodes(IonChannel, allowed_hierarchy=(1, 1)).items():
+        for node in self._ion_channel_nodes():
             node.post_integral(self.V.value)
         return self.get_spike()
 
     def get_spike(self):
-        if not hasattr(self, '_v_last_time'):
-            raise ValueError("The membrane potential is not initialized.")
-        if self._v_last_time is None:
+        last_V = getattr(self, '_v_last_time', None)
+        if last_V is None:
             raise ValueError("The membrane potential is not initialized.")
-        return self.spk_fun(self.V.value - self.V_th) * self.spk_fun(self.V_th - self._v_last_time)
+        V_th = self.V_th
+        return self.spk_fun(self.V.value - V_th) * self.spk_fun(V_th - last_V)
@@ -20,7 +20,7 @@ from typing import Union, Optional, Callable
 import brainstate as bst
 import brainunit as u
 
-from dendritex._base import HHTypedNeuron, IonChannel
+from dendritex._base import HHTypedNeuron
 from dendritex._integrators import DiffEqState
 
 __all__ = [
@@ -96,35 +96,52 @@ class SingleCompartment(HHTypedNeuron):
 
     def pre_integral(self, *args):
         self._v_last_time = self.V.value
-        for key, node in self.nodes(IonChannel, allowed_hierarchy=(1, 1)).items():
+        for node in self._ion_channel_nodes():
             node.pre_integral(self.V.value)
 
+    def current(self, V):
+        """
+        Compute the total current of all ion channels.
+
+        Args:
+          V: The membrane potential.
+
+        Returns:
+          The sum of the channel currents, as one expression.
+        """
+        channels = self._ion_channel_nodes()
+        if len(channels) == 0:
+            return 0. * u.nA / u.cm ** 2
+        return sum((ch.current(V) for ch in channels[1:]), channels[0].current(V))
+
     def compute_derivative(self, x=0. * u.nA / u.cm ** 2):
+        channels = self._ion_channel_nodes()
+        V = self.V.value
+
         # [ Compute the derivative of membrane potential ]
         # 1. inputs + 2. synapses
-        x = self.sum_current_inputs(x, self.V.value)
+        x = self.sum_current_inputs(x, V)
 
         # 3. channels
-        for key, ch in self.nodes(IonChannel, allowed_hierarchy=(1, 1)).items():
-            x = x + ch.current(self.V.value)
+        x = x + self.current(V)
 
         # 4. derivatives
         self.V.derivative = x / self.C
 
         # [ integrate dynamics of ion and ion channels ]
         # check whether the children channels have the correct parents.
-        for key, node in self.nodes(IonChannel, allowed_hierarchy=(1, 1)).items():
-            node.compute_derivative(self.V.value)
+        for node in channels:
+            node.compute_derivative(V)
 
     def update(self, *args):
         self.V.value = self.sum_delta_inputs(init=self.V.value)
-        for key, node in self.nodes(IonChannel, allowed_hierarchy=(1, 1)).items():
+        for node in self._ion_channel_nodes():
             node.post_integral(self.V.value)
         return self.get_spike()
 
     def get_spike(self):
-        if not hasattr(self, '_v_last_time'):
-            raise ValueError("The membrane potential is not initialized.")
-        if self._v_last_time is None:
+        last_V = getattr(self, '_v_last_time', None)
+        if last_V is None:
             raise ValueError("The membrane potential is not initialized.")
-        return self.spk_fun(self.V.value - self.V_th) * self.spk_fun(self.V_th - self._v_last_time)
+        V_th = self.V_th
+        return self.spk_fun(self.V.value - V_th) * self.spk_fun(V_th - last_V)
@@ -13,17 +13,29 @@
 # limitations under the License.
 # ==============================================================================
 
-import brainstate as bst
-import brainunit as u
-import matplotlib.pyplot as plt
+import os
 
-import dendritex as dx
+import jax
+
+# keep compiled programs on disk next to this script, so that re-running the example
+# skips the compilation; this has to be configured before anything is compiled
+cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.jax_cache')
+jax.config.update('jax_compilation_cache_dir', cache_dir)
+jax.config.update('jax_persistent_cache_min_entry_size_bytes', 0)
+jax.config.update('jax_persistent_cache_min_compile_time_secs', 0.1)
+
+import brainstate as bst  # noqa: E402
+import brainunit as u  # noqa: E402
+import jax.numpy as jnp  # noqa: E402
+import matplotlib.pyplot as plt  # noqa: E402
+
+import dendritex as dx  # noqa: E402
 
 bst.environ.set(dt=0.01 * u.ms)
 
 
 class HH(dx.neurons.SingleCompartment):
-    def __init__(self, size):
+    def __init__(self, size, gl=0.03 * (u.mS / u.cm ** 2)):
         super().__init__(size)
 
         self.na = dx.ions.SodiumFixed(size, E=50. * u.mV)
@@ -32,19 +44,50 @@ class HH(dx.neurons.SingleCompartment):
         self.k = dx.ions.PotassiumFixed(size, E=-77. * u.mV)
         self.k.add_elem(IK=dx.channels.IK_HH1952(size))
 
-        self.IL = dx.channels.IL(size, E=-54.387 * u.mV, g_max=0.03 * (u.mS / u.cm ** 2))
+        self.IL = dx.channels.IL(size, E=-54.387 * u.mV, g_max=gl)
 
-    def step_fun(self, t):
-        dx.rk2_step(self, t, 10 * u.nA / u.cm ** 2)
+    def step_fun(self, t, inp):
+        dx.rk2_step(self, t, inp)
         # spike = self.update()
-        return self.V.value
 
 
-hh = HH([1, 1])
-hh.init_state()
+# parameter and input sweeps are laid out along the neuron axes, so every variant advances in
+# the same vectorized step: one row per leak conductance, one neuron per input level
+num = 100
+inputs = u.math.linspace(0., 20., num) * u.nA / u.cm ** 2
+gls = u.math.linspace(0.02, 0.05, 4) * (u.mS / u.cm ** 2)
+hh = HH((gls.size, num), gl=gls[:, None])
+
+# record the membrane potential only every ``record_every`` steps
+record_every = 10
+duration = 100.  # ms
+
+
+@bst.compile.jit(static_argnums=(0, 1))
+def simulate(dt, n_step):
+    # ``dt`` (in ms) and ``n_step`` are static: every setting is compiled once, and
+    # calling again with the same setting reuses the compiled program
+    with bst.environ.context(dt=dt * u.ms):
+        hh.init_state()
+        times = u.math.arange(n_step) * bst.environ.get_dt()
+
+        # the whole time loop, including every integration step, is compiled into one XLA program
+        def run_block(ts):
+            # the inner loop only advances the states, nothing is stacked per step
+            bst.compile.for_loop(lambda t: hh.step_fun(t, inputs), ts)
+            # the states stay in float32, only the recorded trace is stored in half precision
+            return hh.V.value.astype(jnp.float16)
+
+        return bst.compile.for_loop(run_block, times.reshape((-1, record_every)))
 
-times = u.math.arange(10000) * bst.environ.get_dt()
-vs = bst.compile.for_loop(hh.step_fun, times)
 
-plt.plot(times, u.math.squeeze(vs))
+fig, axes = plt.subplots(2, 1, sharex=True)
+for ax, dt in zip(axes, (0.01, 0.05)):
+    n_step = round(duration / dt)
+    vs = simulate(dt, n_step).astype(jnp.float32)  # (n_step // record_every, n_gl, num)
+    record_times = (u.math.arange(n_step) * dt * u.ms)[record_every - 1::record_every]
+    for j in range(gls.size):
+        ax.plot(record_times, vs[:, j, -1], label=f'gl = {gls[j]}')
+    ax.set_title(f'dt = {dt} ms, I = {inputs[-1]}')
+axes[0].legend()
 plt.show()